@@ -1,14 +1,66 @@
 import argparse
+import atexit
+import codecs
+import datetime
+import gc
+import io
 import json
+import math
 import os
+import stat
+import tempfile
+import threading
+from collections import OrderedDict, defaultdict, deque
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, NamedTuple, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 import httpx
 import yaml
 from fastmcp import FastMCP
 
+try:
+    from yaml import CSafeDumper as _YDumper
+    from yaml import CSafeLoader as _YLoader
+except ImportError:
+    from yaml import SafeDumper as _YDumper
+    from yaml import SafeLoader as _YLoader
+
+try:
+    import orjson
+
+    _have_orjson = True
+except ImportError:
+    _have_orjson = False
+
+try:
+    import h2  # noqa: F401 - httpx needs it for HTTP/2
+
+    _have_h2 = True
+except ImportError:
+    _have_h2 = False
+
+_COMPONENT_REF_PREFIX = "#/components/"
+_COMPONENT_REF_PREFIX_LEN = len(_COMPONENT_REF_PREFIX)
+
+# Operation keys of a path item; anything else (parameters, summary, x-* extensions) is skipped
+_HTTP_METHODS = frozenset({"get", "post", "put", "delete", "patch", "head", "options", "trace"})
+
+# Slices share structure with the loaded spec: operations and components are referenced,
+# never copied, and slices are cached per processor. Nothing in this module mutates them,
+# so treat returned slices as read-only rather than reaching for copy.deepcopy.
+
+
+class Endpoint(NamedTuple):
+    """A single operation in the spec, as listed by list_endpoints."""
+
+    path: str
+    method: str
+    summary: str
+    operationId: str
+
 
 class OpenAPISpecProcessor:
     """Processes OpenAPI specifications and extracts relevant parts for specific endpoints."""
@@ -17,108 +69,316 @@ class OpenAPISpecProcessor:
         self.spec = spec_data
         self._components = spec_data.get("components", {})
         self._paths = spec_data.get("paths", {})
+        self._openapi_version = spec_data.get("openapi", "3.0.0")
+        self._info = spec_data.get("info", {})
+        self._servers = spec_data.get("servers", [])
+        self._slice_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._endpoints_cache: Optional[Tuple[Endpoint, ...]] = None
+        self._endpoint_count: Optional[int] = None
 
     def extract_endpoint_slice(self, path: str, method: str) -> Dict[str, Any]:
         """Extract only the relevant parts of the OpenAPI spec for a specific endpoint."""
         method = method.lower()
 
+        # The spec is immutable once loaded, so each slice only needs building once
+        cached = self._slice_cache.get((path, method))
+        if cached is not None:
+            return cached
+
         if path not in self._paths or method not in self._paths[path]:
             raise ValueError(f"Endpoint {method.upper()} {path} not found in spec")
 
         # Start with basic spec structure
         slice_spec = {
-            "openapi": self.spec.get("openapi", "3.0.0"),
-            "info": self.spec.get("info", {}),
-            "servers": self.spec.get("servers", []),
+            "openapi": self._openapi_version,
+            "info": self._info,
+            "servers": self._servers,
             "paths": {path: {method: self._paths[path][method]}},
             "components": {},
         }
 
         # Find all referenced components for this endpoint
-        referenced_schemas = self._find_referenced_components(self._paths[path][method])
+        referenced = self._find_referenced_components(self._paths[path][method])
 
         # Add only the referenced components
-        if referenced_schemas:
-            slice_spec["components"] = self._extract_components(referenced_schemas)
+        if referenced:
+            slice_spec["components"] = self._extract_components(referenced)
 
+        # Keep the spec-wide security requirement the endpoint inherits, so the security
+        # schemes in the slice are still referenced
+        if "security" not in self._paths[path][method] and "security" in self.spec:
+            slice_spec["security"] = self.spec["security"]
+
+        self._slice_cache[(path, method)] = slice_spec
         return slice_spec
 
-    def _find_referenced_components(self, endpoint_spec: Dict[str, Any]) -> Set[str]:
-        """Recursively find all $ref components used by an endpoint."""
-        refs = set()
-
-        def extract_refs(obj: Any) -> None:
-            if isinstance(obj, dict):
-                if "$ref" in obj:
-                    ref_path = obj["$ref"]
-                    if ref_path.startswith("#/components/schemas/"):
-                        schema_name = ref_path.split("/")[-1]
-                        refs.add(schema_name)
-                for value in obj.values():
-                    extract_refs(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    extract_refs(item)
+    def _find_referenced_components(self, endpoint_spec: Dict[str, Any]) -> Dict[str, Set[str]]:
+        """Find all components referenced by an endpoint, directly or through other components.
+
+        Returns a mapping of component type (e.g. 'schemas', 'parameters') to referenced names.
+        """
+        queue = deque()
+        visited = defaultdict(set)
+
+        def extract_refs(root: Any) -> None:
+            # Iterative walk - avoids a Python call per node on large specs
+            stack = [root]
+            while stack:
+                obj = stack.pop()
+                obj_type = type(obj)
+                if obj_type is dict:
+                    ref_path = obj.get("$ref")
+                    if type(ref_path) is str and ref_path.startswith(_COMPONENT_REF_PREFIX):
+                        comp_type, _, name = ref_path[_COMPONENT_REF_PREFIX_LEN:].partition("/")
+                        # Refs may point inside a component, e.g. #/components/schemas/Pet/properties/id
+                        if "/" in name:
+                            name = name.partition("/")[0]
+                        if name and name not in visited[comp_type]:
+                            queue.append((comp_type, name))
+                    stack.extend(obj.values())
+                elif obj_type is list:
+                    stack.extend(obj)
 
         extract_refs(endpoint_spec)
 
-        # Recursively find nested references
-        found_new_refs = True
-        while found_new_refs:
-            found_new_refs = False
-            current_refs = refs.copy()
-            for ref in current_refs:
-                if ref in self._components.get("schemas", {}):
-                    schema = self._components["schemas"][ref]
-                    old_count = len(refs)
-                    extract_refs(schema)
-                    if len(refs) > old_count:
-                        found_new_refs = True
-
-        return refs
-
-    def _extract_components(self, schema_names: Set[str]) -> Dict[str, Any]:
+        # Walk each referenced component exactly once; this also terminates on circular refs
+        while queue:
+            comp_type, name = queue.popleft()
+            names = visited[comp_type]
+            if name in names:
+                continue
+            names.add(name)
+            section = self._components.get(comp_type)
+            if isinstance(section, dict) and name in section:
+                extract_refs(section[name])
+
+        # Security schemes are referenced by name from security requirements, not via $ref
+        security = endpoint_spec.get("security", self.spec.get("security")) or []
+        for requirement in security:
+            if isinstance(requirement, dict):
+                visited["securitySchemes"].update(requirement)
+
+        return visited
+
+    def _extract_components(self, refs: Dict[str, Set[str]]) -> Dict[str, Any]:
         """Extract only the specified components from the full spec."""
         components = {}
 
-        if schema_names and "schemas" in self._components:
-            components["schemas"] = {}
-            for name in schema_names:
-                if name in self._components["schemas"]:
-                    components["schemas"][name] = self._components["schemas"][name]
-
-        # Copy other component types if they exist and might be referenced
-        for comp_type in [
-            "responses",
-            "parameters",
-            "examples",
-            "requestBodies",
-            "headers",
-            "securitySchemes",
-            "links",
-            "callbacks",
-        ]:
-            if comp_type in self._components:
-                # For now, include all of these - could be made more selective
-                components[comp_type] = self._components[comp_type]
+        for comp_type, names in refs.items():
+            section = self._components.get(comp_type)
+            if not isinstance(section, dict):
+                continue
+            # NB: shared references - the values are the spec's own component objects
+            found = {name: section[name] for name in names if name in section}
+            if found:
+                components[comp_type] = found
 
         return components
 
-    def list_endpoints(self) -> List[Dict[str, str]]:
-        """List all available endpoints in the spec."""
+    def list_endpoints(self) -> Tuple[Endpoint, ...]:
+        """List all available endpoints in the spec.
+
+        The result is cached and shared between callers, hence a tuple rather than a list.
+        """
+        if self._endpoints_cache is not None:
+            return self._endpoints_cache
+
         endpoints = []
         for path, methods in self._paths.items():
             for method in methods.keys():
-                if method not in ["parameters", "summary", "description"]:
+                if method in _HTTP_METHODS:
                     endpoints.append(
-                        {
-                            "path": path,
-                            "method": method.upper(),
-                            "summary": methods[method].get("summary", ""),
-                            "operationId": methods[method].get("operationId", ""),
-                        }
+                        Endpoint(
+                            path,
+                            method.upper(),
+                            methods[method].get("summary", ""),
+                            methods[method].get("operationId", ""),
+                        )
                     )
-        return endpoints
+        self._endpoints_cache = tuple(endpoints)
+        self._endpoint_count = len(endpoints)
+        return self._endpoints_cache
+
+    @property
+    def endpoint_count(self) -> int:
+        """Number of endpoints in the spec, counted without building the endpoint list."""
+        if self._endpoint_count is None:
+            self._endpoint_count = sum(
+                method in _HTTP_METHODS for methods in self._paths.values() for method in methods
+            )
+        return self._endpoint_count
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize YAML dates and timestamps as ISO 8601 strings, the way orjson does."""
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _loads_json(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    return orjson.loads(data) if _have_orjson else json.loads(data)
+
+
+# Tools run in a thread pool, so overlapping parses share one pause of the process-wide GC
+_gc_lock = threading.Lock()
+_gc_pause_depth = 0
+_gc_was_enabled = False
+
+
+@contextmanager
+def _gc_paused():
+    """Pause the cyclic GC until the last overlapping pause ends, then restore its state."""
+    global _gc_pause_depth, _gc_was_enabled
+    with _gc_lock:
+        if _gc_pause_depth == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pause_depth += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_pause_depth -= 1
+            if _gc_pause_depth == 0 and _gc_was_enabled:
+                gc.enable()
+
+
+def _parse_yaml(stream: Any) -> Any:
+    """Parse YAML with the cyclic GC paused.
+
+    Every object the loader allocates stays alive, so collections triggered during a large
+    parse only cost time.
+    """
+    with _gc_paused():
+        return yaml.load(stream, Loader=_YLoader)
+
+
+def _reject_alias_cycles(root: Any) -> None:
+    """Raise ValueError if YAML aliases made any node of the parsed data contain itself.
+
+    The rest of the server assumes the spec is a tree and would walk such a node forever.
+    JSON can't represent it either, so it can't be a valid OpenAPI document.
+    """
+    ancestors = set()
+    done = set()
+    # (node, leaving) pairs - a node stays in ancestors until its whole subtree is walked
+    stack = [(root, False)]
+    while stack:
+        obj, leaving = stack.pop()
+        if leaving:
+            ancestors.discard(id(obj))
+            done.add(id(obj))
+            continue
+        obj_type = type(obj)
+        if obj_type is not dict and obj_type is not list:
+            continue
+        if id(obj) in ancestors:
+            raise ValueError("Recursive YAML aliases are not supported in OpenAPI specs")
+        if id(obj) in done:
+            continue
+        ancestors.add(id(obj))
+        stack.append((obj, True))
+        values = obj.values() if obj_type is dict else obj
+        stack.extend((value, False) for value in values)
+
+
+def _is_json_compatible(root: Any) -> bool:
+    """Check that data parsed from YAML comes back unchanged from a JSON round trip.
+
+    YAML allows things JSON doesn't: non-string keys (e.g. unquoted `200:` response codes),
+    dates and non-finite floats. Expects data that already passed _reject_alias_cycles.
+    """
+    # Aliases can still share nodes, so walk each container only once
+    seen = set()
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        obj_type = type(obj)
+        if obj_type is dict or obj_type is list:
+            if id(obj) in seen:
+                continue
+            seen.add(id(obj))
+            if obj_type is dict:
+                if not all(type(key) is str for key in obj):
+                    return False
+                stack.extend(obj.values())
+            else:
+                stack.extend(obj)
+        elif obj_type is float:
+            if not math.isfinite(obj):
+                return False
+        elif obj is not None and obj_type not in (str, int, bool):
+            return False
+    return True
+
+
+def _load_yaml_spec(path: Path) -> Any:
+    """Parse a YAML spec, reusing a JSON sidecar cache written for the same file contents.
+
+    The sidecar records the source's st_mtime_ns and st_size, so it is also invalidated when
+    an older file is copied over the spec with its timestamps preserved.
+    """
+    cache = path.with_name(path.name + ".cache.json")
+    source_stat = path.stat()
+    try:
+        cached = _loads_json(cache.read_bytes())
+        if cached["mtime_ns"] == source_stat.st_mtime_ns and cached["size"] == source_stat.st_size:
+            return cached["spec"]
+    except (OSError, ValueError, KeyError, TypeError):
+        # Missing, unreadable or corrupt cache - fall back to parsing the YAML
+        pass
+
+    with open(path, "r", encoding="utf-8") as f:
+        spec_data = _parse_yaml(f)
+    _reject_alias_cycles(spec_data)
+
+    if not _is_json_compatible(spec_data):
+        # A sidecar would load back different data than the YAML parse - don't write one
+        return spec_data
+
+    sidecar = {"mtime_ns": source_stat.st_mtime_ns, "size": source_stat.st_size, "spec": spec_data}
+    # Write to a unique temporary file first so concurrent loaders never see a partial cache
+    tmp = None
+    try:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=cache.name + ".", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(sidecar) if _have_orjson else json.dumps(sidecar).encode("utf-8"))
+        # mkstemp creates the file owner-only; give the cache the same permissions as the spec
+        os.chmod(tmp, stat.S_IMODE(source_stat.st_mode) & 0o666)
+        os.replace(tmp, cache)
+    except (OSError, TypeError, ValueError):
+        # Read-only directory or data the JSON encoder still rejects (e.g. huge ints) - skip caching
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+    return spec_data
+
+
+# How many parsed specs to keep around for callers that alternate between specs
+_SPEC_CACHE_SIZE = 4
+
+
+@lru_cache(maxsize=_SPEC_CACHE_SIZE)
+def _load_spec_file(abs_path: str, mtime_ns: int, size: int) -> Optional[OpenAPISpecProcessor]:
+    """Parse a local spec file, returning None if it isn't an OpenAPI spec.
+
+    mtime_ns and size are only part of the cache key, the same pair the JSON sidecar is
+    keyed on, so an edited or replaced file is parsed again.
+    """
+    path = Path(abs_path)
+    if path.suffix.lower() in [".yaml", ".yml"]:
+        spec_data = _load_yaml_spec(path)
+    else:
+        spec_data = _loads_json(path.read_bytes())
+
+    if not isinstance(spec_data, dict) or "paths" not in spec_data:
+        return None
+    return OpenAPISpecProcessor(spec_data)
 
 
 # Create the MCP server
@@ -133,6 +393,19 @@ mcp = FastMCP(
     """,
 )
 
+# Shared HTTP client so repeated fetches reuse connections (and HTTP/2 when h2 is installed)
+_HTTP = httpx.Client(
+    http2=_have_h2,
+    follow_redirects=True,
+    headers={"Accept": "application/json, application/yaml;q=0.9, */*;q=0.8"},
+)
+atexit.register(_HTTP.close)
+
+# Recently fetched remote specs: url -> (processor, ETag, Last-Modified), oldest first
+_url_cache: OrderedDict[str, Tuple[OpenAPISpecProcessor, Optional[str], Optional[str]]] = OrderedDict()
+# Tools run in a thread pool, so every access to _url_cache goes through this lock
+_url_cache_lock = threading.Lock()
+
 # Global variable to store the loaded spec processor
 current_processor: Optional[OpenAPISpecProcessor] = None
 
@@ -147,20 +420,18 @@ def load_openapi_spec(file_path: str) -> str:
         if not path.exists():
             return f"Error: File {file_path} does not exist"
 
-        with open(path, "r", encoding="utf-8") as f:
-            if path.suffix.lower() in [".yaml", ".yml"]:
-                spec_data = yaml.safe_load(f)
-            elif path.suffix.lower() == ".json":
-                spec_data = json.load(f)
-            else:
-                return "Error: File must be a .yaml, .yml, or .json file"
+        if path.suffix.lower() not in [".yaml", ".yml", ".json"]:
+            return "Error: File must be a .yaml, .yml, or .json file"
 
-        if not isinstance(spec_data, dict) or "paths" not in spec_data:
+        source_stat = path.stat()
+        processor = _load_spec_file(str(path.resolve()), source_stat.st_mtime_ns, source_stat.st_size)
+        if processor is None:
             return "Error: Invalid OpenAPI specification - must contain 'paths' section"
 
-        current_processor = OpenAPISpecProcessor(spec_data)
+        current_processor = processor
+        spec_data = processor.spec
 
-        endpoints_count = len([path for path in spec_data.get("paths", {}).keys()])
+        endpoints_count = len(spec_data.get("paths") or {})
         spec_title = spec_data.get("info", {}).get("title", "Unknown")
         spec_version = spec_data.get("info", {}).get("version", "Unknown")
 
@@ -188,16 +459,16 @@ def list_endpoints() -> str:
         if not endpoints:
             return "No endpoints found in the specification."
 
-        result = "Available endpoints:\n\n"
+        lines = ["Available endpoints:", ""]
         for endpoint in endpoints:
-            result += f"• {endpoint['method']} {endpoint['path']}"
-            if endpoint["summary"]:
-                result += f" - {endpoint['summary']}"
-            if endpoint["operationId"]:
-                result += f" (operationId: {endpoint['operationId']})"
-            result += "\n"
+            parts = [f"• {endpoint.method} {endpoint.path}"]
+            if endpoint.summary:
+                parts.append(f" - {endpoint.summary}")
+            if endpoint.operationId:
+                parts.append(f" (operationId: {endpoint.operationId})")
+            lines.append("".join(parts))
 
-        return result
+        return "\n".join(lines) + "\n"
 
     except Exception as e:
         return f"Error listing endpoints: {str(e)}"
@@ -224,9 +495,13 @@ def extract_endpoint_slice(path: str, method: str, output_format: str = "yaml")
         slice_spec = current_processor.extract_endpoint_slice(path, method)
 
         if output_format.lower() == "json":
-            return json.dumps(slice_spec, indent=2)
+            if _have_orjson:
+                return orjson.dumps(
+                    slice_spec, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ).decode()
+            return json.dumps(slice_spec, indent=2, ensure_ascii=False, default=_json_default)
         else:
-            return yaml.dump(slice_spec, default_flow_style=False, sort_keys=False)
+            return yaml.dump(slice_spec, Dumper=_YDumper, default_flow_style=False, sort_keys=False)
 
     except ValueError as e:
         return f"Error: {str(e)}"
@@ -253,37 +528,95 @@ def load_openapi_spec_from_url(url: str, timeout: int = 30) -> str:
         if parsed_url.scheme not in ['http', 'https']:
             return "Error: Only HTTP and HTTPS URLs are supported"
         
-        # Fetch the specification
-        with httpx.Client(timeout=timeout) as client:
-            response = client.get(url)
-            response.raise_for_status()
-            
-            content_type = response.headers.get('content-type', '').lower()
-            
+        # Revalidate a previously fetched copy instead of downloading and parsing it again
+        with _url_cache_lock:
+            cached = _url_cache.get(url)
+        headers = {}
+        if cached is not None:
+            _, etag, last_modified = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
+        processor = None
+        
+        # Fetch the specification, buffering raw bytes so the parsers never need a decoded copy
+        with _HTTP.stream("GET", url, timeout=timeout, headers=headers) as response:
+            if response.status_code == 304 and cached is not None:
+                processor = cached[0]
+            else:
+                response.raise_for_status()
+                
+                content_type = response.headers.get('content-type', '').lower()
+                etag = response.headers.get('etag')
+                last_modified = response.headers.get('last-modified')
+                
+                buf = io.BytesIO()
+                for chunk in response.iter_bytes(65536):
+                    buf.write(chunk)
+                buf.seek(0)
+                
+                # The parsers read raw bytes as UTF-8, so transcode any other declared charset
+                charset = response.charset_encoding
+                try:
+                    if charset and codecs.lookup(charset).name != 'utf-8':
+                        text = buf.getvalue().decode(charset, errors='replace')
+                        buf = io.BytesIO(text.encode('utf-8'))
+                except LookupError:
+                    pass
+        
+        if processor is None:
             # Parse based on content type or URL extension
             if 'application/json' in content_type or url.lower().endswith('.json'):
-                spec_data = response.json()
+                spec_data = _loads_json(buf.getvalue())
             elif ('application/yaml' in content_type or 
                   'application/x-yaml' in content_type or 
                   'text/yaml' in content_type or
                   url.lower().endswith(('.yaml', '.yml'))):
-                spec_data = yaml.safe_load(response.text)
+                spec_data = _parse_yaml(buf)
+                _reject_alias_cycles(spec_data)
             else:
-                # Try to parse as YAML first, then JSON
-                try:
-                    spec_data = yaml.safe_load(response.text)
-                except yaml.YAMLError:
+                # YAML would accept JSON too, but is far slower - try JSON first if the body looks like it
+                spec_data = None
+                body = buf.getvalue()
+                if body.lstrip()[:1] in (b"{", b"["):
+                    try:
+                        spec_data = _loads_json(body)
+                    except ValueError:
+                        # Covers JSONDecodeError and UnicodeDecodeError for non-UTF-8 bodies
+                        pass
+                if spec_data is None:
                     try:
-                        spec_data = response.json()
-                    except json.JSONDecodeError:
+                        spec_data = _parse_yaml(buf)
+                    except yaml.YAMLError:
                         return "Error: Unable to parse response as YAML or JSON"
+                    _reject_alias_cycles(spec_data)
+            
+            if not isinstance(spec_data, dict) or "paths" not in spec_data:
+                return "Error: Invalid OpenAPI specification - must contain 'paths' section"
+            
+            processor = OpenAPISpecProcessor(spec_data)
+            
+            # Only responses with validators can be revalidated later
+            with _url_cache_lock:
+                _url_cache.pop(url, None)
+                if etag or last_modified:
+                    _url_cache[url] = (processor, etag, last_modified)
+                    if len(_url_cache) > _SPEC_CACHE_SIZE:
+                        _url_cache.popitem(last=False)
+        else:
+            # Another call may have evicted url since the lookup, so re-insert before bumping it
+            with _url_cache_lock:
+                _url_cache[url] = cached
+                _url_cache.move_to_end(url)
+                if len(_url_cache) > _SPEC_CACHE_SIZE:
+                    _url_cache.popitem(last=False)
         
-        if not isinstance(spec_data, dict) or "paths" not in spec_data:
-            return "Error: Invalid OpenAPI specification - must contain 'paths' section"
-        
-        current_processor = OpenAPISpecProcessor(spec_data)
+        current_processor = processor
+        spec_data = processor.spec
         
-        endpoints_count = len([path for path in spec_data.get("paths", {}).keys()])
+        endpoints_count = len(spec_data.get("paths") or {})
         spec_title = spec_data.get("info", {}).get("title", "Unknown")
         spec_version = spec_data.get("info", {}).get("version", "Unknown")
         
@@ -312,8 +645,7 @@ def get_server_status() -> str:
         return "Status: No OpenAPI specification loaded"
 
     try:
-        endpoints = current_processor.list_endpoints()
-        return f"Status: OpenAPI specification loaded with {len(endpoints)} endpoints available"
+        return f"Status: OpenAPI specification loaded with {current_processor.endpoint_count} endpoints available"
     except Exception as e:
         return f"Status: Error - {str(e)}"
 
@@ -0,0 +1,78 @@
+import os
+
+import httpx
+import pytest
+
+import main
+
+SPEC_YAML = """\
+openapi: 3.0.0
+info: {title: Remote, version: "1"}
+paths:
+  /a:
+    get:
+      responses:
+        "200": {description: ok}
+"""
+
+
+def _tool(tool):
+    # fastmcp 2.x wraps @mcp.tool functions in a FunctionTool; later versions return them as-is
+    return getattr(tool, "fn", tool)
+
+
+@pytest.fixture
+def remote(monkeypatch):
+    """Serve SPEC_YAML with an ETag, answering 304 to a matching If-None-Match."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("if-none-match") == '"v1"':
+            remote.on_not_modified()
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            headers={"content-type": "application/yaml", "etag": '"v1"'},
+            content=SPEC_YAML.encode("utf-8"),
+        )
+
+    remote.requests = requests
+    remote.on_not_modified = lambda: None
+    monkeypatch.setattr(main, "_HTTP", httpx.Client(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(main, "_url_cache", main.OrderedDict())
+    return remote
+
+
+def test_not_modified_reuses_cached_processor(remote):
+    load = _tool(main.load_openapi_spec_from_url)
+
+    assert load("http://example.com/spec").startswith("Successfully loaded")
+    first = main.current_processor
+    assert load("http://example.com/spec").startswith("Successfully loaded")
+
+    assert remote.requests[1].headers["if-none-match"] == '"v1"'
+    assert main.current_processor is first
+
+
+def test_not_modified_survives_concurrent_eviction(remote):
+    load = _tool(main.load_openapi_spec_from_url)
+    load("http://example.com/spec")
+    # Another call evicts the entry while this one is waiting for its 304
+    remote.on_not_modified = main._url_cache.clear
+
+    assert load("http://example.com/spec").startswith("Successfully loaded")
+    assert "http://example.com/spec" in main._url_cache
+
+
+def test_replaced_file_with_same_mtime_is_parsed_again(tmp_path):
+    load = _tool(main.load_openapi_spec)
+    spec_file = tmp_path / "spec.yaml"
+    spec_file.write_text(SPEC_YAML, encoding="utf-8")
+    st = spec_file.stat()
+    load(str(spec_file))
+
+    spec_file.write_text(SPEC_YAML.replace("Remote", "Replaced"), encoding="utf-8")
+    os.utime(spec_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert "Replaced" in load(str(spec_file))
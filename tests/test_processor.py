@@ -0,0 +1,230 @@
+import gc
+import io
+import json
+
+import pytest
+
+import main
+from main import (
+    OpenAPISpecProcessor,
+    _parse_yaml,
+    _reject_alias_cycles,
+    extract_endpoint_slice,
+    load_openapi_spec,
+)
+
+
+def _tool(tool):
+    # fastmcp 2.x wraps @mcp.tool functions in a FunctionTool; later versions return them as-is
+    return getattr(tool, "fn", tool)
+
+
+def test_self_referencing_schema():
+    spec = {
+        "openapi": "3.0.0",
+        "paths": {
+            "/nodes": {
+                "get": {
+                    "responses": {
+                        "200": {
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/Self"}
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        },
+        "components": {
+            "schemas": {
+                "Self": {
+                    "type": "object",
+                    "properties": {"child": {"$ref": "#/components/schemas/Self"}},
+                },
+                "Unused": {"type": "string"},
+            }
+        },
+    }
+
+    slice_spec = OpenAPISpecProcessor(spec).extract_endpoint_slice("/nodes", "GET")
+
+    assert slice_spec["components"] == {"schemas": {"Self": spec["components"]["schemas"]["Self"]}}
+
+
+ALIAS_CYCLE_YAML = """\
+openapi: 3.0.0
+info: {title: Cycle, version: "1"}
+paths:
+  /nodes:
+    post:
+      requestBody: &node
+        content:
+          application/json:
+            schema:
+              properties:
+                child: *node
+      responses: {}
+"""
+
+
+def test_alias_cycle_is_rejected():
+    spec_data = _parse_yaml(io.StringIO(ALIAS_CYCLE_YAML))
+
+    with pytest.raises(ValueError, match="Recursive YAML aliases"):
+        _reject_alias_cycles(spec_data)
+
+
+def test_shared_aliases_are_accepted():
+    spec_data = _parse_yaml(io.StringIO("a: &shared {x: 1}\nb: *shared\n"))
+
+    _reject_alias_cycles(spec_data)
+
+
+def test_load_reports_alias_cycle(tmp_path):
+    spec_file = tmp_path / "cycle.yaml"
+    spec_file.write_text(ALIAS_CYCLE_YAML, encoding="utf-8")
+
+    result = _tool(load_openapi_spec)(str(spec_file))
+
+    assert result == "Error loading file: Recursive YAML aliases are not supported in OpenAPI specs"
+    assert not (tmp_path / "cycle.yaml.cache.json").exists()
+
+
+COMPONENTS_SPEC = {
+    "openapi": "3.0.0",
+    "security": [{"apiKey": []}],
+    "paths": {
+        "/pets/{id}": {
+            "get": {
+                "parameters": [{"$ref": "#/components/parameters/PetId"}],
+                "responses": {
+                    "200": {"$ref": "#/components/responses/Pet"},
+                    "404": {"$ref": "#/components/responses/NotFound"},
+                },
+            },
+            "delete": {
+                "security": [{"oauth": ["write"]}],
+                "parameters": [{"$ref": "#/components/parameters/PetId"}],
+                "responses": {"204": {"description": "Deleted"}},
+            },
+        }
+    },
+    "components": {
+        "parameters": {
+            "PetId": {"name": "id", "in": "path", "schema": {"$ref": "#/components/schemas/Id"}},
+            "Limit": {"name": "limit", "in": "query", "schema": {"type": "integer"}},
+        },
+        "responses": {
+            "Pet": {
+                "description": "A pet",
+                "content": {
+                    "application/json": {
+                        "schema": {"$ref": "#/components/schemas/Pet/properties/owner"}
+                    }
+                },
+            },
+            "NotFound": {"description": "Not found"},
+            "ServerError": {"description": "Server error"},
+        },
+        "schemas": {
+            "Id": {"type": "string"},
+            "Pet": {"properties": {"owner": {"$ref": "#/components/schemas/Owner"}}},
+            "Owner": {"type": "object"},
+            "Unused": {"type": "object"},
+        },
+        "securitySchemes": {
+            "apiKey": {"type": "apiKey", "in": "header", "name": "X-Key"},
+            "oauth": {"type": "oauth2", "flows": {}},
+        },
+    },
+}
+
+
+def test_only_referenced_parameters_and_responses_are_included():
+    components = OpenAPISpecProcessor(COMPONENTS_SPEC).extract_endpoint_slice("/pets/{id}", "get")[
+        "components"
+    ]
+
+    assert set(components["parameters"]) == {"PetId"}
+    assert set(components["responses"]) == {"Pet", "NotFound"}
+
+
+def test_refs_are_followed_into_component_bodies():
+    components = OpenAPISpecProcessor(COMPONENTS_SPEC).extract_endpoint_slice("/pets/{id}", "get")[
+        "components"
+    ]
+
+    # Id comes from a parameter body; a ref inside Pet pulls in Pet itself and then Owner
+    assert set(components["schemas"]) == {"Id", "Pet", "Owner"}
+
+
+def test_global_security_is_carried_into_the_slice():
+    slice_spec = OpenAPISpecProcessor(COMPONENTS_SPEC).extract_endpoint_slice("/pets/{id}", "get")
+
+    assert slice_spec["security"] == [{"apiKey": []}]
+    assert set(slice_spec["components"]["securitySchemes"]) == {"apiKey"}
+
+
+def test_operation_security_overrides_global_security():
+    slice_spec = OpenAPISpecProcessor(COMPONENTS_SPEC).extract_endpoint_slice(
+        "/pets/{id}", "delete"
+    )
+
+    assert "security" not in slice_spec
+    assert slice_spec["paths"]["/pets/{id}"]["delete"]["security"] == [{"oauth": ["write"]}]
+    assert set(slice_spec["components"]["securitySchemes"]) == {"oauth"}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_output_is_the_same_with_and_without_orjson(tmp_path, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(main, "_have_orjson", use_orjson)
+    spec_file = tmp_path / "spec.yaml"
+    spec_file.write_text(
+        """\
+openapi: 3.0.0
+info: {title: Café, version: "1"}
+paths:
+  /a:
+    get:
+      responses:
+        200:
+          description: ok
+          content: {application/json: {example: {since: 2024-01-02, at: 2024-01-02T03:04:05Z}}}
+""",
+        encoding="utf-8",
+    )
+    assert _tool(load_openapi_spec)(str(spec_file)).startswith("Successfully loaded")
+
+    output = _tool(extract_endpoint_slice)("/a", "GET", output_format="json")
+
+    assert '"title": "Café"' in output
+    example = json.loads(output)["paths"]["/a"]["get"]["responses"]["200"]["content"]
+    assert example["application/json"]["example"] == {
+        "since": "2024-01-02",
+        "at": "2024-01-02T03:04:05+00:00",
+    }
+
+
+def test_gc_is_restored_after_interleaved_pauses():
+    # Two parses on different threads: A starts, B starts, A finishes, then B finishes
+    pause_a, pause_b = main._gc_paused(), main._gc_paused()
+    pause_a.__enter__()
+    pause_b.__enter__()
+    pause_a.__exit__(None, None, None)
+    assert not gc.isenabled()
+    pause_b.__exit__(None, None, None)
+
+    assert gc.isenabled()
+
+
+def test_gc_pause_leaves_gc_disabled_if_it_already_was():
+    gc.disable()
+    try:
+        _parse_yaml(io.StringIO("a: 1"))
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
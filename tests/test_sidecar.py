@@ -0,0 +1,80 @@
+import json
+import os
+import stat
+
+from main import _load_yaml_spec
+
+SPEC_YAML = """\
+openapi: 3.0.0
+info: {title: Sidecar, version: "1"}
+paths:
+  /a:
+    get:
+      responses:
+        "200": {description: ok}
+"""
+
+
+def _write_spec(tmp_path, text=SPEC_YAML):
+    spec_file = tmp_path / "spec.yaml"
+    spec_file.write_text(text, encoding="utf-8")
+    return spec_file, tmp_path / "spec.yaml.cache.json"
+
+
+def _tamper(cache):
+    # Rewrite the cached spec so a load that reuses the sidecar is distinguishable from a parse
+    sidecar = json.loads(cache.read_text(encoding="utf-8"))
+    sidecar["spec"]["info"]["title"] = "From sidecar"
+    cache.write_text(json.dumps(sidecar), encoding="utf-8")
+
+
+def test_sidecar_reused_when_mtime_and_size_match(tmp_path):
+    spec_file, cache = _write_spec(tmp_path)
+
+    assert _load_yaml_spec(spec_file)["info"]["title"] == "Sidecar"
+    assert cache.exists()
+
+    _tamper(cache)
+    assert _load_yaml_spec(spec_file)["info"]["title"] == "From sidecar"
+
+
+def test_sidecar_invalidated_when_mtime_changes(tmp_path):
+    spec_file, cache = _write_spec(tmp_path)
+    _load_yaml_spec(spec_file)
+    _tamper(cache)
+
+    st = spec_file.stat()
+    os.utime(spec_file, ns=(st.st_atime_ns, st.st_mtime_ns - 1_000_000_000))
+
+    assert _load_yaml_spec(spec_file)["info"]["title"] == "Sidecar"
+
+
+def test_sidecar_invalidated_when_size_changes(tmp_path):
+    spec_file, cache = _write_spec(tmp_path)
+    _load_yaml_spec(spec_file)
+    _tamper(cache)
+
+    # Same mtime, as after `cp -p` of a different file over the spec
+    st = spec_file.stat()
+    spec_file.write_text(SPEC_YAML.replace("Sidecar", "Copied over"), encoding="utf-8")
+    os.utime(spec_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert _load_yaml_spec(spec_file)["info"]["title"] == "Copied over"
+
+
+def test_no_sidecar_for_data_json_would_change(tmp_path):
+    spec_file, cache = _write_spec(tmp_path, SPEC_YAML.replace('"200":', "200:"))
+
+    spec_data = _load_yaml_spec(spec_file)
+
+    assert 200 in spec_data["paths"]["/a"]["get"]["responses"]
+    assert not cache.exists()
+
+
+def test_sidecar_permissions_match_spec(tmp_path):
+    spec_file, cache = _write_spec(tmp_path)
+    spec_file.chmod(0o644)
+
+    _load_yaml_spec(spec_file)
+
+    assert stat.S_IMODE(cache.stat().st_mode) == 0o644